@@ -1,15 +1,42 @@
 import argparse
+import hashlib
+import html
 import json
+import re
 import sys
 import time
+import timeit
 import os
+import posixpath
 import shutil
+import socket
+import sqlite3
+import threading
+import zipfile
+from io import BytesIO
+from itertools import groupby
 from pathlib import Path
 from datetime import datetime
 from docx import Document
+from docx.text.hyperlink import Hyperlink
 from docx2pdf import convert
+from lxml import etree
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
 
 CONFIG_FILE = Path.home() / ".HireMe_config.json"
+SPOOL_DIRS = ("pending", "claimed", "done", "failed")
+ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
+OUTPUT_FORMATS = ("pdf", "txt", "html", "md")
+HISTORY_DB_NAME = "history.sqlite3"
+SLIM_IMAGE_MAX_PX = 1600
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+RELS_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+CONTENT_TYPES_NS = "http://schemas.openxmlformats.org/package/2006/content-types"
+XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
 
 def save_config(storage_location, template_location, template_map, output_docx_dir, output_pdf_dir, swap_words=None):
     if swap_words is None:
@@ -94,6 +121,10 @@ def configure():
         shutil.copyfile(src_path, dst_path)
     print("[✓] Copy complete.")
 
+    if ask_slim_templates():
+        for file in template_files:
+            slim_template(os.path.join(templates_dir, file))
+
     template_map = {}
     for i, filename in enumerate(template_files, start=1):
         while True:
@@ -228,6 +259,7 @@ def update_templates(custom_template_source=None):
         print("[✓] No new templates found to add.")
     else:
         print(f"[+] Found {len(new_files)} new template(s) to add.")
+        slim_new_templates = ask_slim_templates()
 
         added_count = 0
         for i, filename in enumerate(new_files, start=1):
@@ -247,6 +279,8 @@ def update_templates(custom_template_source=None):
 
                 if os.path.abspath(src_path) != os.path.abspath(dst_path):
                     shutil.copy2(src_path, dst_path)
+                if slim_new_templates:
+                    slim_template(dst_path)
 
                 existing_map[keyword] = filename
                 added_count += 1
@@ -283,6 +317,183 @@ def update_templates(custom_template_source=None):
 
 
 
+def w_tag(name):
+    return f"{{{W_NS}}}{name}"
+
+
+def merge_plain_runs(root):
+    # Word splits text into runs at every revision/proofing boundary, which also splits {{LABELS}}
+    for paragraph in root.iter(w_tag("p")):
+        prev_text, prev_key = None, None
+        for child in list(paragraph):
+            children = list(child) if child.tag == w_tag("r") else None
+            if not children or any(c.tag not in (w_tag("rPr"), w_tag("t")) for c in children) or len(child.findall(w_tag("t"))) != 1:
+                prev_text = None
+                continue
+
+            rpr = child.find(w_tag("rPr"))
+            key = etree.tostring(rpr) if rpr is not None else b""
+            text = child.find(w_tag("t"))
+            if prev_text is not None and key == prev_key:
+                prev_text.text = (prev_text.text or "") + (text.text or "")
+                prev_text.set(XML_SPACE, "preserve")
+                paragraph.remove(child)
+            else:
+                prev_text, prev_key = text, key
+
+
+def slim_word_xml(data):
+    root = etree.fromstring(data)
+
+    for element in root.iter():
+        if not isinstance(element.tag, str):
+            continue
+        for attr in [a for a in element.attrib if a.startswith(f"{{{W_NS}}}rsid")]:
+            del element.attrib[attr]
+
+    for name in ("proofErr", "rsids", "proofState"):
+        for element in list(root.iter(w_tag(name))):
+            element.getparent().remove(element)
+
+    merge_plain_runs(root)
+    return etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+
+def slim_styles(members):
+    styles_root = etree.fromstring(members["word/styles.xml"])
+    styles = {s.get(w_tag("styleId")): s for s in styles_root.iter(w_tag("style"))}
+
+    used = set()
+    for name, data in members.items():
+        if name == "word/styles.xml" or not (name.startswith("word/") and name.endswith(".xml")):
+            continue
+        for element in etree.fromstring(data).iter(w_tag("pStyle"), w_tag("rStyle"), w_tag("tblStyle"), w_tag("numStyleLink"), w_tag("styleLink")):
+            used.add(element.get(w_tag("val")))
+
+    used.update(style_id for style_id, style in styles.items() if style.get(w_tag("default")) in ("1", "true", "on"))
+
+    pending = list(used)
+    while pending:
+        style = styles.get(pending.pop())
+        if style is None:
+            continue
+        for name in ("basedOn", "link", "next"):
+            ref = style.find(w_tag(name))
+            if ref is not None and ref.get(w_tag("val")) not in used:
+                used.add(ref.get(w_tag("val")))
+                pending.append(ref.get(w_tag("val")))
+
+    for style_id, style in styles.items():
+        if style_id not in used:
+            style.getparent().remove(style)
+
+    members["word/styles.xml"] = etree.tostring(styles_root, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+
+def slim_image(data, max_px):
+    try:
+        image = Image.open(BytesIO(data))
+        image_format = image.format
+        # re-encoding a lossy image at its own size only loses quality and metadata
+        if image_format not in ("JPEG", "PNG") or max(image.size) <= max_px:
+            return data
+        # the displayed size comes from the document (wp:extent), so only pixel density drops
+        image.thumbnail((max_px, max_px))
+        output = BytesIO()
+        if image_format == "JPEG":
+            image.save(output, "JPEG", quality=85, optimize=True)
+        else:
+            image.save(output, "PNG", optimize=True)
+    except Exception:
+        return data
+    return output.getvalue() if output.tell() < len(data) else data
+
+
+def prune_package_references(members, removed):
+    for name in [n for n in members if n.endswith(".rels")]:
+        root = etree.fromstring(members[name])
+        source_dir = posixpath.dirname(posixpath.dirname(name))
+        for rel in list(root.iter(f"{{{RELS_NS}}}Relationship")):
+            if rel.get("TargetMode") == "External":
+                continue
+            target = rel.get("Target", "")
+            part = target.lstrip("/") if target.startswith("/") else posixpath.normpath(posixpath.join(source_dir, target))
+            if part in removed:
+                root.remove(rel)
+        members[name] = etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+    root = etree.fromstring(members["[Content_Types].xml"])
+    for override in list(root.iter(f"{{{CONTENT_TYPES_NS}}}Override")):
+        if override.get("PartName", "").lstrip("/") in removed:
+            root.remove(override)
+    members["[Content_Types].xml"] = etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+
+def time_docx_parse(data, repeat=5):
+    # single parses vary more than the savings being reported, so take the best of several
+    return min(timeit.repeat(lambda: Document(BytesIO(data)), number=1, repeat=repeat)) * 1000
+
+
+def slim_template(template_path, max_image_px=SLIM_IMAGE_MAX_PX):
+    with open(template_path, "rb") as f:
+        original = f.read()
+
+    try:
+        with zipfile.ZipFile(BytesIO(original)) as src:
+            order = src.namelist()
+            members = {name: src.read(name) for name in order}
+
+        removed = {n for n in members if n.startswith("customXml/") or n.startswith("docProps/thumbnail")}
+        for name in removed:
+            del members[name]
+        prune_package_references(members, removed)
+
+        for name in members:
+            if name.startswith("word/") and name.endswith(".xml"):
+                members[name] = slim_word_xml(members[name])
+        if "word/styles.xml" in members:
+            slim_styles(members)
+
+        if Image is not None:
+            for name in [n for n in members if n.startswith("word/media/")]:
+                members[name] = slim_image(members[name], max_image_px)
+
+        buffer = BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED, compresslevel=9) as dst:
+            for name in order:
+                if name in members:
+                    dst.writestr(name, members[name])
+        slimmed = buffer.getvalue()
+
+        parse_before = time_docx_parse(original)
+        parse_after = time_docx_parse(slimmed)
+    except Exception as e:
+        print(f"[!] Could not optimize {os.path.basename(template_path)}, keeping original. Reason: {e}")
+        return
+
+    if len(slimmed) >= len(original):
+        print(f"[✓] {os.path.basename(template_path)}: already lean, kept original.")
+        return
+
+    with open(template_path, "wb") as f:
+        f.write(slimmed)
+
+    saved = 100 * (len(original) - len(slimmed)) / len(original)
+    print(
+        f"[✓] {os.path.basename(template_path)}: {len(original) / 1024:.1f} KB → {len(slimmed) / 1024:.1f} KB (-{saved:.0f}%), "
+        f"parse {parse_before:.1f} ms → {parse_after:.1f} ms"
+    )
+
+
+def ask_slim_templates():
+    print("\n[?] Optimize templates (strip revision IDs, proofing marks, custom XML, thumbnails, unused styles and shrink images)? [Y]es/[N]o (Default=No)")
+    if input("> ").strip().lower() not in ("y", "yes"):
+        return False
+    if Image is None:
+        print("[!] Pillow is not installed, embedded images will not be recompressed (pip install \"hireme-clg[images]\").")
+    return True
+
+
 def show_config_summary():
     config = load_config()
     swap_words = config.get("swapWords", [])
@@ -459,6 +670,22 @@ def validate_config(config):
     return True
 
 
+def select_template(template_keywords, template_keyword):
+    if len(template_keywords) > 1 and not template_keyword:
+        print("[!] Multiple templates found. You must specify one using --template.")
+        print(f"[>] Available templates: {', '.join(template_keywords.keys())}")
+        return None
+
+    if len(template_keywords) > 1:
+        if template_keyword not in template_keywords:
+            print(f"[!] Invalid template keyword: '{template_keyword}'")
+            print(f"[>] Available templates: {', '.join(template_keywords.keys())}")
+            return None
+        return template_keyword
+
+    return list(template_keywords.keys())[0] if template_keywords else None
+
+
 class CustomArgumentParser(argparse.ArgumentParser):
     def __init__(self, *args, **kwargs):
         if 'formatter_class' not in kwargs:
@@ -517,14 +744,228 @@ class WideHelpFormatter(argparse.HelpFormatter):
         self._indent_increment = 2
 
 
+def save_docx_deterministic(doc, path):
+    buffer = BytesIO()
+    doc.save(buffer)
+
+    with zipfile.ZipFile(buffer) as src:
+        members = {name: src.read(name) for name in src.namelist()}
+
+    # [Content_Types].xml and the package rels lead, like Word writes them; the rest is sorted
+    leading = [name for name in ("[Content_Types].xml", "_rels/.rels") if name in members]
+    order = leading + sorted(name for name in members if name not in leading)
+
+    with zipfile.ZipFile(path, "w") as dst:
+        for name in order:
+            info = zipfile.ZipInfo(name, date_time=ZIP_EPOCH)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.create_system = 3
+            info.external_attr = 0o644 << 16
+            dst.writestr(info, members[name], compresslevel=6)
+
+
+def paragraph_heading_level(paragraph):
+    style_name = paragraph.style.name if paragraph.style is not None else ""
+    if style_name == "Title":
+        return 1
+    match = re.fullmatch(r"Heading ([1-6])", style_name)
+    return int(match.group(1)) if match else 0
+
+
+def render_run_group(runs, output_format):
+    parts = []
+    # merge neighbouring runs with the same emphasis so markers are not split mid-word
+    for (bold, italic, underline), runs in groupby(runs, key=lambda r: (bool(r.bold), bool(r.italic), bool(r.underline))):
+        text = "".join(run.text for run in runs)
+        core = text.strip()
+        if not core:
+            parts.append(text)
+            continue
+        lead, trail = text[:len(text) - len(text.lstrip())], text[len(text.rstrip()):]
+
+        if output_format == "html":
+            core = html.escape(core)
+            if underline:
+                core = f"<u>{core}</u>"
+            if italic:
+                core = f"<em>{core}</em>"
+            if bold:
+                core = f"<strong>{core}</strong>"
+        else:
+            core = re.sub(r"([\\`*_\[\]<>#])", r"\\\1", core)
+            if italic:
+                core = f"*{core}*"
+            if bold:
+                core = f"**{core}**"
+
+        parts.append(f"{lead}{core}{trail}")
+
+    return "".join(parts)
+
+
+def render_hyperlink(hyperlink, output_format):
+    text = render_run_group(hyperlink.runs, output_format)
+    url = hyperlink.url
+    if not url or not text.strip():
+        return text
+    if output_format == "html":
+        return f'<a href="{html.escape(url, quote=True)}">{text}</a>'
+    return f"[{text}]({url.replace(' ', '%20').replace(')', '%29')})"
+
+
+def render_runs(paragraph, output_format):
+    parts, runs = [], []
+    # paragraph.runs skips runs nested in <w:hyperlink>, so walk the inner content instead
+    for item in paragraph.iter_inner_content():
+        if isinstance(item, Hyperlink):
+            parts.append(render_run_group(runs, output_format))
+            parts.append(render_hyperlink(item, output_format))
+            runs = []
+        else:
+            runs.append(item)
+    parts.append(render_run_group(runs, output_format))
+
+    # python-docx reports <w:br/> as "\n", which HTML and Markdown would both fold into a space
+    if output_format == "html":
+        return "".join(parts).replace("\n", "<br>\n")
+    return "".join(parts).strip("\n").replace("\n", "\\\n")
+
+
+def render_document(doc, output_format):
+    if output_format == "txt":
+        return "\n".join(paragraph.text for paragraph in doc.paragraphs) + "\n"
+
+    blocks = []
+    for paragraph in doc.paragraphs:
+        if not paragraph.text.strip():
+            continue
+        body = render_runs(paragraph, output_format)
+        level = paragraph_heading_level(paragraph)
+        if output_format == "html":
+            tag = f"h{level}" if level else "p"
+            blocks.append(f"<{tag}>{body}</{tag}>")
+        else:
+            blocks.append(f"{'#' * level} {body}" if level else body)
+
+    if output_format == "html":
+        return (
+            "<!DOCTYPE html>\n<html>\n<head><meta charset=\"utf-8\"></head>\n<body>\n"
+            + "\n".join(blocks)
+            + "\n</body>\n</html>\n"
+        )
+    return "\n\n".join(blocks) + "\n"
+
+
+def open_history(storage_location):
+    conn = sqlite3.connect(os.path.join(storage_location, HISTORY_DB_NAME), timeout=30)
+    conn.executescript("""
+        CREATE TABLE IF NOT EXISTS generations (
+            id INTEGER PRIMARY KEY,
+            company TEXT NOT NULL COLLATE NOCASE,
+            role TEXT NOT NULL COLLATE NOCASE,
+            date TEXT,
+            template TEXT,
+            output_format TEXT,
+            docx_path TEXT,
+            output_path TEXT,
+            input_hash TEXT,
+            seconds REAL,
+            created TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_generations_company_role ON generations (company, role);
+        CREATE INDEX IF NOT EXISTS idx_generations_role ON generations (role);
+        CREATE INDEX IF NOT EXISTS idx_generations_template ON generations (template);
+        CREATE INDEX IF NOT EXISTS idx_generations_input_hash ON generations (input_hash);
+        CREATE INDEX IF NOT EXISTS idx_generations_created ON generations (created);
+    """)
+    try:
+        conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS letters USING fts5(text)")
+    except sqlite3.OperationalError:
+        # sqlite builds without FTS5 fall back to a plain table searched with LIKE
+        conn.execute("CREATE TABLE IF NOT EXISTS letters (text TEXT)")
+    return conn
+
+
+def history_has_fts(conn):
+    row = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'letters'").fetchone()
+    return bool(row and "fts5" in row[0].lower())
+
+
+def record_generation(storage_location, record, letter_text):
+    try:
+        conn = open_history(storage_location)
+        with conn:
+            cursor = conn.execute(
+                """INSERT INTO generations
+                   (company, role, date, template, output_format, docx_path, output_path, input_hash, seconds, created)
+                   VALUES (:company, :role, :date, :template, :output_format, :docx_path, :output_path, :input_hash, :seconds, :created)""",
+                record
+            )
+            conn.execute("INSERT INTO letters (rowid, text) VALUES (?, ?)", (cursor.lastrowid, letter_text))
+        conn.close()
+    except sqlite3.Error as e:
+        print(f"[!] Could not record generation history: {e}")
+
+
+def like_prefix(value):
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+
+def show_history(company=None, role=None, template_keyword=None, search=None, limit=20):
+    config = load_config()
+    storage_location = config.get("storageLocation")
+    if not storage_location or not os.path.exists(os.path.join(storage_location, HISTORY_DB_NAME)):
+        print("[!] No generation history recorded yet.")
+        return
+
+    conn = open_history(storage_location)
+    clauses, params = [], []
+    if company:
+        clauses.append("company LIKE ? ESCAPE '\\'")
+        params.append(like_prefix(company))
+    if role:
+        clauses.append("role LIKE ? ESCAPE '\\'")
+        params.append(like_prefix(role))
+    if template_keyword:
+        clauses.append("template = ?")
+        params.append(template_keyword)
+    if search:
+        if history_has_fts(conn):
+            clauses.append("id IN (SELECT rowid FROM letters WHERE letters MATCH ?)")
+            params.append(" ".join('"' + term.replace('"', '""') + '"' for term in search.split()))
+        else:
+            clauses.append("id IN (SELECT rowid FROM letters WHERE text LIKE ? ESCAPE '\\')")
+            params.append("%" + like_prefix(search))
+
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    rows = conn.execute(
+        f"""SELECT created, company, role, date, template, output_path, seconds
+            FROM generations {where} ORDER BY created DESC, id DESC LIMIT ?""",
+        params + [limit]
+    ).fetchall()
+    conn.close()
+
+    if not rows:
+        print("[!] No matching generations found.")
+        return
+
+    print(f"\n[✓] {len(rows)} matching generation(s), newest first:")
+    for created, company_name, role_name, date, template, output_path, seconds in rows:
+        print(f"  - {created}  {company_name} | {role_name} | date {date} | template '{template}' | {seconds:.2f}s")
+        print(f"      {output_path}")
+
+
 ####################################################################################################
 ####################################### MEAT AND POTATOES ##########################################
 ####################################################################################################
-def generate_cover_letter(company, role, date, template_keyword):
-    config = load_config()
+def generate_cover_letter(company, role, date, template_keyword, deterministic=False, output_format="pdf", config=None, template_in_name=False):
+    start_time = time.time()
+    if config is None:
+        config = load_config()
 
     swap_words = config.get("swapWords", ["{{COMPANY_NAME}}", "{{ROLE}}", "{{DATE}}"])
     template_keywords = config.get("templateKeywords", {})
+    storage_location = config.get("storageLocation")
     template_dir = config.get("templateLocation")
     output_docx_dir = config.get("outputDocxLocation")
     output_pdf_dir = config.get("outputPdfLocation")
@@ -573,15 +1014,49 @@ def generate_cover_letter(company, role, date, template_keyword):
                 if placeholder in run.text:
                     run.text = run.text.replace(placeholder, replacements.get(placeholder, ""))
 
+    input_hash = hashlib.sha256()
+    with open(template_path, "rb") as f:
+        input_hash.update(f.read())
+    input_hash.update(json.dumps([company, role, date, swap_words, output_format, deterministic]).encode("utf-8"))
+
+    history = {
+        "company": company,
+        "role": role,
+        "date": date,
+        "template": template_keyword,
+        "output_format": output_format,
+        "docx_path": None,
+        "input_hash": input_hash.hexdigest()
+    }
+    letter_text = "\n".join(paragraph.text for paragraph in doc.paragraphs)
+
     safe_company = company.replace(" ", "").replace(".", "")
     safe_role = role.replace(" ", "").replace(".", "")
-    docx_filename = f"CL_{safe_company}_{safe_role}.docx"
-    pdf_filename = f"CL_{safe_company}_{safe_role}.pdf"
+    base_name = f"CL_{safe_company}_{safe_role}"
+    if template_in_name:
+        base_name += "_" + template_keyword.replace(" ", "").replace(".", "")
+
+    if output_format != "pdf":
+        # text formats render straight from memory: no DOCX is written and no converter is started
+        output_path = os.path.join(output_pdf_dir, f"{base_name}.{output_format}")
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(render_document(doc, output_format))
+        print(f"[✓] {output_format.upper()} saved: {output_path}")
+
+        history.update(output_path=output_path, seconds=time.time() - start_time, created=datetime.now().isoformat(timespec="seconds"))
+        record_generation(storage_location, history, letter_text)
+        return output_path
+
+    docx_filename = f"{base_name}.docx"
+    pdf_filename = f"{base_name}.pdf"
 
     edited_docx_path = os.path.join(output_docx_dir, docx_filename)
     output_pdf_path = os.path.join(output_pdf_dir, pdf_filename)
 
-    doc.save(edited_docx_path)
+    if deterministic:
+        save_docx_deterministic(doc, edited_docx_path)
+    else:
+        doc.save(edited_docx_path)
     print(f"[✓] DOCX saved: {edited_docx_path}")
 
     convert(edited_docx_path)
@@ -589,20 +1064,264 @@ def generate_cover_letter(company, role, date, template_keyword):
     generated_pdf_path = edited_docx_path.replace(".docx", ".pdf")
 
     timeout = 10
-    start_time = time.time()
+    convert_start_time = time.time()
     while not os.path.exists(generated_pdf_path):
-        if time.time() - start_time > timeout:
+        if time.time() - convert_start_time > timeout:
             print(f"[!] PDF was not generated at: {generated_pdf_path}")
             break
         time.sleep(0.5)
     else:
         shutil.move(generated_pdf_path, output_pdf_path)
         print(f"[✓] PDF saved: {output_pdf_path}")
+
+        history.update(
+            docx_path=edited_docx_path,
+            output_path=output_pdf_path,
+            seconds=time.time() - start_time,
+            created=datetime.now().isoformat(timespec="seconds")
+        )
+        record_generation(storage_location, history, letter_text)
+        return output_pdf_path
 ####################################################################################################
 ####################################################################################################
 ####################################################################################################
 
 
+def is_template_list(template_keywords, template_arg):
+    # a configured keyword always wins, even if it is "all" or contains a comma
+    if not template_arg or template_arg in template_keywords:
+        return False
+    return template_arg == "all" or "," in template_arg
+
+
+def expand_template_list(template_keywords, template_arg):
+    if template_arg == "all" and "all" not in template_keywords:
+        return list(template_keywords.keys())
+
+    selected = []
+    for keyword in (k.strip() for k in template_arg.split(",")):
+        if keyword and keyword not in selected:
+            selected.append(keyword)
+
+    invalid = [k for k in selected if k not in template_keywords]
+    if invalid:
+        print(f"[!] Invalid template keyword(s): {', '.join(repr(k) for k in invalid)}")
+        print(f"[>] Available templates: {', '.join(template_keywords.keys())}")
+        return None
+
+    return selected
+
+
+def generate_variants(company, role, date, template_list, deterministic=False, output_format="pdf", config=None):
+    if config is None:
+        config = load_config()
+    kwargs = {
+        "deterministic": deterministic,
+        "output_format": output_format,
+        "config": config,
+        "template_in_name": True
+    }
+
+    print(f"[>] Generating {len(template_list)} variant(s): {', '.join(template_list)}")
+
+    # Variants run in this process: docx2pdf drives a single Word/Pages instance, and a text
+    # variant takes ~20 ms while spawning a worker pool (macOS/Windows) costs seconds of imports.
+    results = []
+    for keyword in template_list:
+        try:
+            results.append(generate_cover_letter(company, role, date, keyword, **kwargs))
+        except Exception as e:
+            print(f"[!] Template '{keyword}' failed. Reason: {type(e).__name__}: {e}")
+            results.append(None)
+
+    failed = [keyword for keyword, path in zip(template_list, results) if not path]
+    print(f"\n[✓] Generated {len(template_list) - len(failed)}/{len(template_list)} variant(s).")
+    if failed:
+        print(f"[!] Failed templates: {', '.join(failed)}")
+    return results
+
+
+def spool_claim(spool_dir, worker_id):
+    pending_dir = os.path.join(spool_dir, "pending")
+    lease_dir = os.path.join(spool_dir, "claimed", worker_id)
+    os.makedirs(lease_dir, exist_ok=True)
+
+    for filename in sorted(os.listdir(pending_dir)):
+        if not filename.lower().endswith(".json"):
+            continue
+        pending_path = os.path.join(pending_dir, filename)
+        lease_path = os.path.join(lease_dir, filename)
+        try:
+            # start the lease before the rename, so a reclaimer never sees a claimed job with its old mtime
+            os.utime(pending_path)
+            # rename is atomic on local disks and NFS, so only one worker wins each job
+            os.rename(pending_path, lease_path)
+        except FileNotFoundError:
+            continue
+        return lease_path
+
+    return None
+
+
+def spool_now(spool_dir, worker_id):
+    # lease mtimes are set by the file server, so "now" has to come from the same clock
+    probe_path = os.path.join(spool_dir, f".clock-{worker_id}")
+    with open(probe_path, "a"):
+        pass
+    os.utime(probe_path)
+    return os.path.getmtime(probe_path)
+
+
+def spool_reclaim(spool_dir, lease_seconds, worker_id):
+    claimed_dir = os.path.join(spool_dir, "claimed")
+    pending_dir = os.path.join(spool_dir, "pending")
+    now = spool_now(spool_dir, worker_id)
+
+    for owner in os.listdir(claimed_dir):
+        lease_dir = os.path.join(claimed_dir, owner)
+        if not os.path.isdir(lease_dir):
+            continue
+        for filename in os.listdir(lease_dir):
+            lease_path = os.path.join(lease_dir, filename)
+            try:
+                if now - os.path.getmtime(lease_path) < lease_seconds:
+                    continue
+                os.rename(lease_path, os.path.join(pending_dir, filename))
+            except FileNotFoundError:
+                continue
+            print(f"[!] Reclaimed expired lease from {owner}: {filename}")
+
+
+def spool_heartbeat(lease_path, interval, stop_event):
+    while not stop_event.wait(interval):
+        try:
+            os.utime(lease_path)
+        except FileNotFoundError:
+            return
+
+
+def spool_finish(spool_dir, lease_path, job, result, succeeded):
+    job["result"] = result
+    target_path = os.path.join(spool_dir, "done" if succeeded else "failed", os.path.basename(lease_path))
+    try:
+        os.rename(lease_path, target_path)
+    except FileNotFoundError:
+        print(f"[!] Lease was reclaimed before completion: {os.path.basename(lease_path)}")
+        return
+
+    with open(target_path, "w") as f:
+        json.dump(job, f, indent=4)
+    print(f"[✓] Job {'done' if succeeded else 'failed'}: {os.path.basename(lease_path)} ({result['seconds']}s)")
+
+
+def spool_run_job(spool_dir, lease_path, worker_id, lease_seconds, template_keywords):
+    claimed_at = datetime.now()
+    start_time = time.time()
+    result = {"worker": worker_id, "claimed": claimed_at.isoformat(timespec="seconds")}
+
+    try:
+        with open(lease_path, "r") as f:
+            job = json.load(f)
+    except (OSError, ValueError) as e:
+        job = {}
+        result["error"] = f"Unreadable job file: {e}"
+
+    if not isinstance(job, dict):
+        job = {"job": job}
+        result["error"] = "Job file must contain a JSON object."
+
+    if "error" in result:
+        result.update(finished=datetime.now().isoformat(timespec="seconds"), seconds=0.0)
+        spool_finish(spool_dir, lease_path, job, result, False)
+        return
+
+    stop_event = threading.Event()
+    heartbeat = threading.Thread(
+        target=spool_heartbeat, args=(lease_path, lease_seconds / 3, stop_event), daemon=True
+    )
+    heartbeat.start()
+
+    output_path = None
+    try:
+        if not job.get("company") or not job.get("role"):
+            result["error"] = "Job requires 'company' and 'role'."
+        elif job.get("format", "pdf") not in OUTPUT_FORMATS:
+            result["error"] = f"Unknown format: '{job.get('format')}'"
+        elif job.get("deterministic") and job.get("format", "pdf") != "pdf":
+            result["error"] = "'deterministic' only applies to PDF jobs."
+        elif job.get("format", "pdf") == "pdf" and sys.platform.startswith("linux"):
+            result["error"] = "PDF output needs Microsoft Word (docx2pdf supports Windows and macOS only); use \"format\": \"txt\", \"html\" or \"md\"."
+        else:
+            template_keyword = select_template(template_keywords, job.get("template"))
+            if len(template_keywords) > 1 and not template_keyword:
+                result["error"] = f"Invalid or missing template keyword: '{job.get('template')}'"
+            else:
+                output_path = generate_cover_letter(
+                    job["company"],
+                    job["role"],
+                    job.get("date") or claimed_at.strftime('%m/%d/%y'),
+                    template_keyword,
+                    deterministic=bool(job.get("deterministic")),
+                    output_format=job.get("format", "pdf")
+                )
+                if not output_path:
+                    result["error"] = "Generation failed, see worker output."
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    finally:
+        stop_event.set()
+        heartbeat.join()
+
+    result["finished"] = datetime.now().isoformat(timespec="seconds")
+    result["seconds"] = round(time.time() - start_time, 3)
+    if output_path:
+        result["output"] = output_path
+    spool_finish(spool_dir, lease_path, job, result, output_path is not None)
+
+
+def watch_spool(spool_dir, lease_seconds=600, poll_interval=2.0, stop_when_idle=False):
+    config = load_config()
+    template_keywords = config.get("templateKeywords", {})
+
+    for name in SPOOL_DIRS:
+        os.makedirs(os.path.join(spool_dir, name), exist_ok=True)
+
+    worker_id = f"{socket.gethostname()}-{os.getpid()}"
+    print(f"[>] Watching spool directory: {spool_dir}")
+    print(f"[>] Worker: {worker_id} (lease {lease_seconds}s)")
+    print(f"[>] Drop job files (JSON with company, role [, date, template]) into: {os.path.join(spool_dir, 'pending')}")
+
+    try:
+        while True:
+            spool_reclaim(spool_dir, lease_seconds, worker_id)
+            lease_path = spool_claim(spool_dir, worker_id)
+            if lease_path is None:
+                if stop_when_idle:
+                    break
+                time.sleep(poll_interval)
+                continue
+            print(f"[>] Claimed job: {os.path.basename(lease_path)}")
+            try:
+                spool_run_job(spool_dir, lease_path, worker_id, lease_seconds, template_keywords)
+            except Exception as e:
+                print(f"[!] Job crashed: {os.path.basename(lease_path)}. Reason: {type(e).__name__}: {e}")
+                try:
+                    os.rename(lease_path, os.path.join(spool_dir, "failed", os.path.basename(lease_path)))
+                except OSError:
+                    pass
+    except KeyboardInterrupt:
+        print("\n[✓] Stopped watching.")
+
+    for path in (os.path.join(spool_dir, "claimed", worker_id), os.path.join(spool_dir, f".clock-{worker_id}")):
+        try:
+            if os.path.isdir(path):
+                os.rmdir(path)
+            else:
+                os.unlink(path)
+        except OSError:
+            pass
+
+
 def main():
 
     parser = CustomArgumentParser(description="HireMe Cover Letter Generator")
@@ -613,13 +1332,20 @@ def main():
     parser.add_argument("--company", help="company Name")
     parser.add_argument("--role", help="role title")
     parser.add_argument("--date", help="date [OPTIONAL, DEFAULT is today's date]")
-    parser.add_argument("-T", "--template", help="template keyword to use when generating (required if multiple templates exist)")
+    parser.add_argument("-T", "--template", help="template keyword to use when generating (required if multiple templates exist); a comma-separated list or 'all' generates one letter per template")
+    parser.add_argument("--deterministic", action="store_true", help="write byte-identical DOCX files for identical inputs (used with -G)")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default="pdf", help="output format; txt, html and md skip DOCX/PDF conversion (used with -G)")
     parser.add_argument("--clean", action="store_true", help="clear the storage directory contents")
     parser.add_argument("--update", action="store_true", help="scan for and import new templates")
     parser.add_argument("-S", "--source", help="optional custom path for template update (used with --update)")
     parser.add_argument("-L", "--resetlabels", action="store_true", help="reset or clear the placeholder labels")
     parser.add_argument("-K", "--resetkwds", action="store_true", help="clear all template keywords in configuration")
     parser.add_argument("--reset", action="store_true", help="reset everything: clean, reconfigure, and reset placeholders")
+    parser.add_argument("--history", action="store_true", help="search past generations (filter with --company, --role, -T, --search)")
+    parser.add_argument("--search", help="full-text search over generated letter text (used with --history)")
+    parser.add_argument("--limit", type=int, default=20, help="maximum number of history entries to show (used with --history)")
+    parser.add_argument("--watch", metavar="DIR", help="process job files dropped into a (shared) spool directory")
+    parser.add_argument("--lease", type=int, default=600, help="seconds before a crashed worker's job is reclaimed (used with --watch)")
     parser.add_argument('--info', action='store_true', help='objective truth')
 
     
@@ -736,7 +1462,8 @@ def main():
     if args.show:
         other_flags = any([
             args.generate, args.configure, args.clean, args.update, args.source,
-            args.company, args.role, args.date, args.resetlabels, args.resetkwds, args.reset, args.template
+            args.company, args.role, args.date, args.resetlabels, args.resetkwds, args.reset, args.template,
+            args.history, args.search
         ])
         if other_flags:
             print("[!] --show must be used alone.")
@@ -745,12 +1472,51 @@ def main():
         show_config_summary()
         return
 
+    if args.history or args.search:
+        other_flags = any([
+            args.generate, args.configure, args.clean, args.update, args.source,
+            args.date, args.resetlabels, args.resetkwds, args.reset, args.watch
+        ])
+        if other_flags:
+            print("[!] --history can only be combined with --company, --role, --template, --search and --limit.")
+            exit(1)
+
+        show_history(
+            company=args.company,
+            role=args.role,
+            template_keyword=args.template,
+            search=args.search,
+            limit=args.limit
+        )
+        return
+
+    if args.watch:
+        other_flags = any([
+            args.generate, args.configure, args.clean, args.update, args.source,
+            args.company, args.role, args.date, args.resetlabels, args.resetkwds, args.reset, args.template,
+            args.deterministic, args.format != "pdf"
+        ])
+        if other_flags:
+            print("[!] --watch can only be combined with --lease.")
+            exit(1)
+
+        if args.lease <= 0:
+            print("[!] --lease must be a positive number of seconds.")
+            exit(1)
+
+        watch_spool(args.watch, lease_seconds=args.lease)
+        return
+
     if args.generate:
         if not args.company or not args.role:
             print("[!] --company and --role are required when using -G/--generate.")
             print("[>] usage: HireMe -G --company 'COMPANY_NAME' --role 'ROLE_TITLE' [--date 'DATE'] [-T 'TEMPLATE_KEYWORD']")
             exit(1)
 
+        if args.deterministic and args.format != "pdf":
+            print("[!] --deterministic only applies to DOCX/PDF output and cannot be used with --format txt|html|md.")
+            exit(1)
+
         config = load_config()
         storage_location = config.get("storageLocation")
         template_keywords = config.get("templateKeywords", {})
@@ -759,26 +1525,34 @@ def main():
             print(f"[!] Configured storage location '{storage_location}' does not exist. Run --configure.")
             exit(1)
 
-        if len(template_keywords) > 1 and not args.template:
-            print("[!] Multiple templates found. You must specify one using --template.")
-            print(f"[>] Available templates: {', '.join(template_keywords.keys())}")
-            exit(1)
+        if is_template_list(template_keywords, args.template):
+            template_list = expand_template_list(template_keywords, args.template)
+            if not template_list:
+                print("[!] No templates selected.")
+                exit(1)
 
+            generate_variants(
+                args.company,
+                args.role,
+                args.date or datetime.now().strftime('%m/%d/%y'),
+                template_list,
+                deterministic=args.deterministic,
+                output_format=args.format,
+                config=config
+            )
+            return
 
-        selected_template = args.template
-        if len(template_keywords) > 1:
-            if selected_template not in template_keywords:
-                print(f"[!] Invalid template keyword: '{selected_template}'")
-                print(f"[>] Available templates: {', '.join(template_keywords.keys())}")
-                exit(1)
-        else:
-            selected_template = list(template_keywords.keys())[0] if template_keywords else None
+        selected_template = select_template(template_keywords, args.template)
+        if len(template_keywords) > 1 and not selected_template:
+            exit(1)
 
         generate_cover_letter(
             args.company,
             args.role,
             args.date or datetime.now().strftime('%m/%d/%y'),
-            selected_template
+            selected_template,
+            deterministic=args.deterministic,
+            output_format=args.format
         )
         return
 
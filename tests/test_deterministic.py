@@ -0,0 +1,43 @@
+import hashlib
+import time
+import zipfile
+
+from docx import Document
+
+import clg
+
+
+def build_document():
+    doc = Document()
+    doc.add_heading("Jane Doe", 0)
+    doc.add_paragraph("Dear Big Company, I am applying for High Paying Job.")
+    return doc
+
+
+def sha256(path):
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def test_deterministic_save_is_byte_identical(tmp_path):
+    template_path = tmp_path / "template.docx"
+    build_document().save(template_path)
+
+    first, second = tmp_path / "first.docx", tmp_path / "second.docx"
+    clg.save_docx_deterministic(Document(template_path), first)
+    # ZIP timestamps have a 2 second resolution
+    time.sleep(2.1)
+    clg.save_docx_deterministic(Document(template_path), second)
+
+    assert sha256(first) == sha256(second)
+    assert Document(second).paragraphs[1].text == "Dear Big Company, I am applying for High Paying Job."
+
+
+def test_deterministic_save_orders_members(tmp_path):
+    path = tmp_path / "letter.docx"
+    clg.save_docx_deterministic(build_document(), path)
+
+    with zipfile.ZipFile(path) as package:
+        names = package.namelist()
+        assert names[:2] == ["[Content_Types].xml", "_rels/.rels"]
+        assert names[2:] == sorted(names[2:])
+        assert {info.date_time for info in package.infolist()} == {clg.ZIP_EPOCH}
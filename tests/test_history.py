@@ -0,0 +1,103 @@
+import json
+import sqlite3
+
+import pytest
+
+import clg
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps({"storageLocation": str(tmp_path)}))
+    monkeypatch.setattr(clg, "CONFIG_FILE", config_file)
+    return tmp_path
+
+
+def record(storage, company, role, text, template="main", created="2026-10-19T12:00:00"):
+    clg.record_generation(str(storage), {
+        "company": company,
+        "role": role,
+        "date": "10/19/26",
+        "template": template,
+        "output_format": "txt",
+        "docx_path": None,
+        "output_path": f"/out/{company}_{role}.txt",
+        "input_hash": "abc",
+        "seconds": 0.5,
+        "created": created
+    }, text)
+
+
+def listed(output):
+    return [line.split("|")[0].split()[-1] for line in output.splitlines() if line.startswith("  - ")]
+
+
+def test_record_generation_stores_row_and_letter_text(storage):
+    record(storage, "Acme", "Engineer", "Dear Acme team")
+
+    conn = sqlite3.connect(storage / clg.HISTORY_DB_NAME)
+    row = conn.execute("SELECT company, role, template, output_path, input_hash, seconds FROM generations").fetchone()
+    assert row == ("Acme", "Engineer", "main", "/out/Acme_Engineer.txt", "abc", 0.5)
+    assert conn.execute("SELECT text FROM letters").fetchone() == ("Dear Acme team",)
+    conn.close()
+
+
+def test_company_prefix_is_case_insensitive_and_escapes_wildcards(storage, capsys):
+    record(storage, "Acme", "Engineer", "a")
+    record(storage, "ACME_Labs", "Engineer", "b")
+    record(storage, "Acmex", "Engineer", "c")
+    record(storage, "100%Co", "Engineer", "d")
+    record(storage, "100Co", "Engineer", "e")
+
+    clg.show_history(company="acme_")
+    assert listed(capsys.readouterr().out) == ["ACME_Labs"]
+
+    clg.show_history(company="acme")
+    assert sorted(listed(capsys.readouterr().out)) == ["ACME_Labs", "Acme", "Acmex"]
+
+    clg.show_history(company="100%")
+    assert listed(capsys.readouterr().out) == ["100%Co"]
+
+
+def test_full_text_search(storage, capsys):
+    record(storage, "Acme", "Engineer", "I love distributed systems")
+    record(storage, "Globex", "Engineer", "I love databases")
+
+    conn = clg.open_history(str(storage))
+    assert clg.history_has_fts(conn)
+    conn.close()
+
+    clg.show_history(search='distributed "systems')
+    assert listed(capsys.readouterr().out) == ["Acme"]
+
+
+def test_search_falls_back_to_like_without_fts5(storage, capsys):
+    conn = sqlite3.connect(storage / clg.HISTORY_DB_NAME)
+    conn.execute("CREATE TABLE letters (text TEXT)")
+    conn.close()
+
+    record(storage, "Acme", "Engineer", "I love distributed systems")
+    record(storage, "Globex", "Engineer", "I love 100% of databases")
+
+    conn = clg.open_history(str(storage))
+    assert not clg.history_has_fts(conn)
+    conn.close()
+
+    clg.show_history(search="distributed")
+    assert listed(capsys.readouterr().out) == ["Acme"]
+    clg.show_history(search="100%")
+    assert listed(capsys.readouterr().out) == ["Globex"]
+
+
+def test_limit_and_newest_first_with_tied_timestamps(storage, capsys):
+    for i in range(5):
+        record(storage, f"Company{i}", "Engineer", "text")
+
+    clg.show_history(limit=3)
+    assert listed(capsys.readouterr().out) == ["Company4", "Company3", "Company2"]
+
+
+def test_no_history_yet(storage, capsys):
+    clg.show_history(company="Acme")
+    assert "No generation history recorded yet" in capsys.readouterr().out
@@ -0,0 +1,72 @@
+from docx import Document
+from docx.opc.constants import RELATIONSHIP_TYPE
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+
+import clg
+
+
+def build_document():
+    doc = Document()
+    doc.add_heading("Jane Doe", 0)
+    address = doc.add_paragraph("123 Main St")
+    address.add_run().add_break()
+    address.add_run("Springfield")
+    letter = doc.add_paragraph("Dear team, ")
+    letter.add_run("I want the job").bold = True
+    letter.add_run(" & <more>.")
+    doc.add_paragraph("")
+    return doc
+
+
+def test_txt_keeps_paragraph_text():
+    assert clg.render_document(build_document(), "txt") == (
+        "Jane Doe\n123 Main St\nSpringfield\nDear team, I want the job & <more>.\n\n"
+    )
+
+
+def test_html_renders_emphasis_headings_and_line_breaks():
+    rendered = clg.render_document(build_document(), "html")
+
+    assert "<h1>Jane Doe</h1>" in rendered
+    assert "<p>123 Main St<br>\nSpringfield</p>" in rendered
+    assert "<p>Dear team, <strong>I want the job</strong> &amp; &lt;more&gt;.</p>" in rendered
+    assert "<p></p>" not in rendered
+
+
+def test_markdown_renders_emphasis_headings_and_line_breaks():
+    rendered = clg.render_document(build_document(), "md")
+
+    assert rendered == (
+        "# Jane Doe\n\n"
+        "123 Main St\\\nSpringfield\n\n"
+        "Dear team, **I want the job** & \\<more\\>.\n"
+    )
+
+
+def add_hyperlink(paragraph, text, url):
+    rel_id = paragraph.part.relate_to(url, RELATIONSHIP_TYPE.HYPERLINK, is_external=True)
+    hyperlink = OxmlElement("w:hyperlink")
+    hyperlink.set(qn("r:id"), rel_id)
+    run = OxmlElement("w:r")
+    text_element = OxmlElement("w:t")
+    text_element.text = text
+    run.append(text_element)
+    hyperlink.append(run)
+    paragraph._p.append(hyperlink)
+
+
+def build_linked_document():
+    doc = Document()
+    paragraph = doc.add_paragraph("Email me at ")
+    add_hyperlink(paragraph, "jane@example.com", "mailto:jane@example.com")
+    paragraph.add_run(" thanks")
+    return doc
+
+
+def test_hyperlinks_are_rendered_as_links():
+    doc = build_linked_document()
+
+    assert clg.render_document(doc, "txt") == "Email me at jane@example.com thanks\n"
+    assert '<p>Email me at <a href="mailto:jane@example.com">jane@example.com</a> thanks</p>' in clg.render_document(doc, "html")
+    assert clg.render_document(doc, "md") == "Email me at [jane@example.com](mailto:jane@example.com) thanks\n"
@@ -0,0 +1,67 @@
+import zipfile
+from io import BytesIO
+
+import pytest
+from docx import Document
+
+import clg
+
+
+def make_template(path):
+    doc = Document()
+    paragraph = doc.add_paragraph("Dear {{COMPANY")
+    paragraph.add_run("_NAME}} team")
+    doc.save(path)
+
+    with zipfile.ZipFile(path) as package:
+        members = {name: package.read(name) for name in package.namelist()}
+    members["word/document.xml"] = members["word/document.xml"].replace(b"<w:p>", b'<w:p w:rsidR="00AB12CD">')
+    members["customXml/item1.xml"] = b"<x/>"
+    members["[Content_Types].xml"] = members["[Content_Types].xml"].replace(
+        b"</Types>", b'<Override PartName="/customXml/item1.xml" ContentType="application/xml"/></Types>'
+    )
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_STORED) as package:
+        for name, data in members.items():
+            package.writestr(name, data)
+
+
+def test_slim_template_strips_dead_weight_and_rejoins_labels(tmp_path):
+    path = tmp_path / "template.docx"
+    make_template(path)
+    size_before = path.stat().st_size
+
+    clg.slim_template(str(path))
+
+    assert path.stat().st_size < size_before
+    with zipfile.ZipFile(path) as package:
+        assert not any(name.startswith("customXml/") for name in package.namelist())
+        assert b"customXml" not in package.read("[Content_Types].xml")
+        assert b"rsid" not in package.read("word/document.xml")
+    runs = [run.text for run in Document(path).paragraphs[0].runs]
+    assert runs == ["Dear {{COMPANY_NAME}} team"]
+
+
+def test_slim_image_only_reencodes_oversized_images():
+    Image = pytest.importorskip("PIL.Image")
+
+    small = BytesIO()
+    Image.new("RGB", (400, 300), "white").save(small, "JPEG", quality=100)
+    assert clg.slim_image(small.getvalue(), 1600) == small.getvalue()
+
+    large = BytesIO()
+    Image.effect_noise((3200, 2400), 40).convert("RGB").save(large, "JPEG", quality=100)
+    slimmed = clg.slim_image(large.getvalue(), 1600)
+    assert Image.open(BytesIO(slimmed)).size == (1600, 1200)
+
+
+def test_time_docx_parse_takes_best_of_several_runs(tmp_path, monkeypatch):
+    path = tmp_path / "template.docx"
+    make_template(path)
+    calls = []
+    original_document = clg.Document
+    monkeypatch.setattr(clg, "Document", lambda stream: calls.append(stream) or original_document(stream))
+
+    elapsed = clg.time_docx_parse(path.read_bytes(), repeat=4)
+
+    assert len(calls) == 4
+    assert elapsed > 0
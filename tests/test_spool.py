@@ -0,0 +1,117 @@
+import json
+import multiprocessing
+import os
+import sqlite3
+
+from docx import Document
+
+import clg
+
+
+def make_config(tmp_path):
+    storage = tmp_path / "storage"
+    for name in ("templates", "docxStorage", "outputPDFs"):
+        (storage / name).mkdir(parents=True)
+
+    doc = Document()
+    doc.add_paragraph("Dear {{COMPANY_NAME}}, I am applying for {{ROLE}}.")
+    doc.save(storage / "templates" / "main.docx")
+
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps({
+        "storageLocation": str(storage),
+        "templateLocation": str(storage / "templates"),
+        "outputDocxLocation": str(storage / "docxStorage"),
+        "outputPdfLocation": str(storage / "outputPDFs"),
+        "templateKeywords": {"main": "main.docx"},
+        "swapWords": ["{{COMPANY_NAME}}", "{{ROLE}}", "{{DATE}}"]
+    }))
+    return config_file, storage
+
+
+def write_job(spool, name, job):
+    pending = spool / "pending"
+    pending.mkdir(parents=True, exist_ok=True)
+    (pending / f"{name}.tmp").write_text(json.dumps(job))
+    os.rename(pending / f"{name}.tmp", pending / f"{name}.json")
+
+
+def run_worker(config_file, spool):
+    clg.CONFIG_FILE = config_file
+    clg.watch_spool(str(spool), lease_seconds=60, poll_interval=0.05, stop_when_idle=True)
+
+
+def test_workers_process_each_job_once(tmp_path):
+    config_file, storage = make_config(tmp_path)
+    spool = tmp_path / "spool"
+    for i in range(20):
+        write_job(spool, f"job{i:02d}", {"company": f"Company{i}", "role": "Engineer", "format": "txt"})
+
+    ctx = multiprocessing.get_context("fork")
+    workers = [ctx.Process(target=run_worker, args=(config_file, spool)) for _ in range(3)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(60)
+        assert worker.exitcode == 0
+
+    assert sorted(os.listdir(spool / "done")) == [f"job{i:02d}.json" for i in range(20)]
+    assert os.listdir(spool / "pending") == []
+    assert os.listdir(spool / "failed") == []
+
+    conn = sqlite3.connect(storage / clg.HISTORY_DB_NAME)
+    assert conn.execute("SELECT COUNT(*), COUNT(DISTINCT company) FROM generations").fetchone() == (20, 20)
+    conn.close()
+
+    result = json.loads((spool / "done" / "job00.json").read_text())["result"]
+    assert result["output"].endswith("CL_Company0_Engineer.txt")
+    assert result["seconds"] >= 0
+
+
+def test_expired_lease_is_reclaimed(tmp_path, monkeypatch):
+    config_file, _ = make_config(tmp_path)
+    monkeypatch.setattr(clg, "CONFIG_FILE", config_file)
+    spool = tmp_path / "spool"
+    lease_dir = spool / "claimed" / "deadhost-1"
+    lease_dir.mkdir(parents=True)
+    lease_path = lease_dir / "crashed.json"
+    lease_path.write_text(json.dumps({"company": "Crashed", "role": "Engineer", "format": "md"}))
+    os.utime(lease_path, (0, 0))
+
+    clg.watch_spool(str(spool), lease_seconds=60, poll_interval=0.05, stop_when_idle=True)
+
+    assert os.listdir(lease_dir) == []
+    assert os.listdir(spool / "done") == ["crashed.json"]
+
+
+def test_bad_jobs_fail_without_stopping_the_worker(tmp_path, monkeypatch):
+    config_file, _ = make_config(tmp_path)
+    monkeypatch.setattr(clg, "CONFIG_FILE", config_file)
+    spool = tmp_path / "spool"
+    (spool / "pending").mkdir(parents=True)
+    (spool / "pending" / "list.json").write_text("[1, 2]")
+    (spool / "pending" / "junk.json").write_text("not json")
+    write_job(spool, "missing", {"company": "NoRole"})
+    write_job(spool, "ok", {"company": "Fine", "role": "Engineer", "format": "txt"})
+
+    clg.watch_spool(str(spool), lease_seconds=60, poll_interval=0.05, stop_when_idle=True)
+
+    assert sorted(os.listdir(spool / "failed")) == ["junk.json", "list.json", "missing.json"]
+    assert os.listdir(spool / "done") == ["ok.json"]
+    failed = json.loads((spool / "failed" / "list.json").read_text())
+    assert failed["job"] == [1, 2]
+    assert "JSON object" in failed["result"]["error"]
+
+
+def test_claim_starts_a_fresh_lease(tmp_path):
+    spool = tmp_path / "spool"
+    for name in clg.SPOOL_DIRS:
+        (spool / name).mkdir(parents=True)
+    write_job(spool, "old", {"company": "Old", "role": "Engineer"})
+    os.utime(spool / "pending" / "old.json", (0, 0))
+
+    lease_path = clg.spool_claim(str(spool), "worker-1")
+    clg.spool_reclaim(str(spool), 60, "worker-2")
+
+    assert os.path.exists(lease_path)
+    assert os.listdir(spool / "pending") == []
@@ -0,0 +1,39 @@
+import clg
+
+
+TEMPLATES = {"main": "main.docx", "tech,lead": "tech.docx", "alt": "alt.docx"}
+
+
+def test_exact_keyword_is_not_a_list():
+    assert not clg.is_template_list(TEMPLATES, "tech,lead")
+    assert not clg.is_template_list(TEMPLATES, "main")
+    assert not clg.is_template_list({"all": "all.docx"}, "all")
+    assert not clg.is_template_list(TEMPLATES, None)
+
+
+def test_lists_and_all_are_expanded():
+    assert clg.is_template_list(TEMPLATES, "all")
+    assert clg.is_template_list(TEMPLATES, "main,alt")
+    assert clg.expand_template_list(TEMPLATES, "all") == ["main", "tech,lead", "alt"]
+    assert clg.expand_template_list(TEMPLATES, " alt, main,alt") == ["alt", "main"]
+
+
+def test_unknown_keywords_are_rejected(capsys):
+    assert clg.expand_template_list(TEMPLATES, "main,nope") is None
+    assert "'nope'" in capsys.readouterr().out
+
+
+def test_failing_variant_does_not_abort_the_others(monkeypatch, capsys):
+    def fake_generate(company, role, date, keyword, **kwargs):
+        if keyword == "alt":
+            raise ValueError("broken template")
+        return f"/out/{keyword}.txt"
+
+    monkeypatch.setattr(clg, "generate_cover_letter", fake_generate)
+
+    results = clg.generate_variants("Acme", "Engineer", "01/01/26", ["main", "alt"], output_format="txt", config={})
+
+    assert results == ["/out/main.txt", None]
+    output = capsys.readouterr().out
+    assert "Generated 1/2 variant(s)" in output
+    assert "Failed templates: alt" in output